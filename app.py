@@ -2,7 +2,9 @@ import os
 import logging
 import time
 import json
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from flask import Flask, render_template, request, jsonify, session
 from flask_cors import CORS
@@ -44,6 +46,42 @@ class ChatbotService:
         self.openrouter_base_url = OPENROUTER_BASE_URL
         self.models = AVAILABLE_MODELS
         self.current_model = "mistral"  # Default model
+        self.reset_connections()
+    
+    def reset_connections(self, pool_size=10):
+        """Create a fresh connection pool so a forked worker never shares sockets with its parent"""
+        # One adapter (thread-safe urllib3 pool) shared by per-thread sessions,
+        # sized to the number of request threads so no connection gets discarded
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.local = threading.local()
+    
+    @property
+    def http(self):
+        """Session for the calling thread, backed by the shared connection pool"""
+        if not hasattr(self.local, "session"):
+            session = requests.Session()
+            session.mount("https://", self.adapter)
+            self.local.session = session
+        return self.local.session
+    
+    def warm_up(self):
+        """Open the upstream connection and validate the model registry ahead of the first chat"""
+        start_time = time.time()
+        
+        try:
+            response = self.http.get(
+                f"{self.openrouter_base_url}/models",
+                timeout=(5, 10)
+            )
+            response.raise_for_status()
+            upstream_ids = {model["id"] for model in response.json().get("data", [])}
+            for key, model_info in self.models.items():
+                if model_info["model_id"] not in upstream_ids:
+                    logging.warning(f"Model '{key}' ({model_info['model_id']}) is not listed by OpenRouter")
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            logging.warning(f"Upstream warm-up failed: {str(e)}")
+        
+        return time.time() - start_time
     
     def set_model(self, model_key):
         """Set the current model to use"""
@@ -67,8 +105,12 @@ class ChatbotService:
             }
         }
     
-    def send_message(self, message, conversation_history=None):
+    def send_message(self, message, conversation_history=None, model_key=None):
         """Send message to AI model via appropriate API"""
+        # Resolve the model once so concurrent set_model calls cannot change it mid-request
+        if model_key not in self.models:
+            model_key = self.current_model
+        
         api_config = self.get_api_config()
         
         # Enhanced error checking for deployment
@@ -94,7 +136,7 @@ class ChatbotService:
         messages.append({"role": "user", "content": message})
         
         payload = {
-            "model": self.models[self.current_model]["model_id"],
+            "model": self.models[model_key]["model_id"],
             "messages": messages,
             "max_tokens": 1000,
             "temperature": 0.7
@@ -103,7 +145,7 @@ class ChatbotService:
         start_time = time.time()
         
         try:
-            response = requests.post(
+            response = self.http.post(
                 f"{api_config['base_url']}/chat/completions",
                 headers=headers,
                 json=payload,
@@ -546,31 +588,20 @@ def external_chat_api():
         # Optional conversation history from request
         conversation_history = data.get('conversation_history', [])
         
-        # Optional model selection
+        # Optional model selection, applied to this request only
         model_key = data.get('model', None)
-        original_model = None
-        if model_key:
-            # Temporarily switch model for this request
-            original_model = chatbot.get_current_model()
-            chatbot.set_model(model_key)
+        if model_key not in chatbot.models:
+            model_key = chatbot.current_model
         
         # Send message to AI
-        result = chatbot.send_message(message, conversation_history)
-        
-        # Restore original model if changed
-        if model_key and original_model:
-            # Find the original model key by searching for it
-            for key, model_info in chatbot.models.items():
-                if model_info == original_model:
-                    chatbot.set_model(key)
-                    break
+        result = chatbot.send_message(message, conversation_history, model_key)
         
         if result['success']:
             return jsonify({
                 "success": True,
                 "response": result['response'],
                 "response_time": result['response_time'],
-                "model": chatbot.get_current_model(),
+                "model": chatbot.models[model_key],
                 "timestamp": time.time()
             })
         else:
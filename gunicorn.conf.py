@@ -0,0 +1,103 @@
+import os
+import math
+import threading
+import time
+
+# Gunicorn loads this file before it preloads the app, so this covers the import
+_config_loaded_at = time.time()
+
+# Gunicorn configuration for ChatMind Pro
+# Every value can be overridden through environment variables
+
+# Server socket
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Load the app once in the master so workers fork from a ready image
+preload_app = True
+
+# Worker sizing - chat requests spend nearly all their time waiting on OpenRouter,
+# so keep few processes (memory) and let threads cover the expected I/O concurrency
+if hasattr(os, "sched_getaffinity"):
+    cpu_count = len(os.sched_getaffinity(0))
+else:
+    cpu_count = os.cpu_count() or 1
+workers = int(os.getenv("WEB_CONCURRENCY", min(cpu_count + 1, 4)))
+expected_concurrency = int(os.getenv("EXPECTED_CONCURRENCY", "16"))
+threads = int(os.getenv("GUNICORN_THREADS", max(2, math.ceil(expected_concurrency / workers))))
+worker_class = "gthread"
+
+# Timeouts - upstream read timeout is 45s, leave headroom on top of it
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+
+# Recycle workers gradually; jitter keeps them from restarting all at once
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+# Heartbeat files on tmpfs avoid worker stalls on slow container disks
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+# Set GUNICORN_WARM_UP=false to compare first-request latency against cold workers
+warm_up_workers = os.getenv("GUNICORN_WARM_UP", "true").lower() == "true"
+
+# Logging
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+_preload_finished_at = None
+
+
+def on_starting(server):
+    """Record when the preloaded app import has finished"""
+    global _preload_finished_at
+    _preload_finished_at = time.time()
+
+
+def when_ready(server):
+    """Log app preload time and total master startup time"""
+    server.log.info(
+        f"App preloaded in {_preload_finished_at - _config_loaded_at:.3f}s, "
+        f"master ready in {time.time() - _config_loaded_at:.3f}s "
+        f"(workers={workers}, threads={threads})"
+    )
+
+
+def post_fork(server, worker):
+    """Give each worker its own upstream connections and warm them up"""
+    from app import chatbot
+
+    chatbot.reset_connections(pool_size=threads)
+    worker.first_request_lock = threading.Lock()
+    worker.first_request_paths = set()
+
+    if warm_up_workers:
+        warm_up_time = chatbot.warm_up()
+        server.log.info(f"Worker {worker.pid} warmed up in {warm_up_time:.3f}s")
+
+
+def post_worker_init(worker):
+    """Log how long the worker took from config load to accepting requests"""
+    worker.log.info(
+        f"Worker {worker.pid} booted {time.time() - _config_loaded_at:.3f}s after startup"
+    )
+
+
+def pre_request(worker, req):
+    """Stamp each request so its latency can be measured on any thread"""
+    req.started_at = time.time()
+
+
+def post_request(worker, req, environ, resp):
+    """Log the first request per path in each worker so cold and warm workers can be compared"""
+    with worker.first_request_lock:
+        if req.path in worker.first_request_paths:
+            return
+        worker.first_request_paths.add(req.path)
+
+    worker.log.info(
+        f"Worker {worker.pid} first request {req.method} {req.path} "
+        f"took {time.time() - req.started_at:.3f}s"
+    )
@@ -0,0 +1,68 @@
+"""Measure gunicorn startup time and first chat latency with and without worker warm-up.
+
+Usage: OPENROUTER_API_KEY=... python measure_warmup.py
+"""
+import os
+import sys
+import time
+import subprocess
+import requests
+
+PORT = os.getenv("MEASURE_PORT", "5055")
+BASE_URL = f"http://127.0.0.1:{PORT}"
+
+
+def measure(warm_up):
+    """Start a single-worker server and time its startup and first chat request"""
+    env = dict(os.environ, PORT=PORT, WEB_CONCURRENCY="1",
+               GUNICORN_WARM_UP="true" if warm_up else "false")
+    start_time = time.time()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "--config", "gunicorn.conf.py", "main:app"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+    try:
+        while True:
+            if server.poll() is not None:
+                raise RuntimeError("gunicorn exited during startup")
+            if time.time() - start_time > 60:
+                raise RuntimeError("gunicorn did not become ready within 60s")
+            try:
+                if requests.get(f"{BASE_URL}/api/v1/status", timeout=1).status_code == 200:
+                    break
+            except requests.exceptions.RequestException:
+                time.sleep(0.05)
+        startup_time = time.time() - start_time
+
+        request_start = time.time()
+        response = requests.post(
+            f"{BASE_URL}/api/v1/chat",
+            json={"message": "Say hello in one word."},
+            timeout=60
+        )
+        first_request_time = time.time() - request_start
+
+        return {
+            "startup_time": startup_time,
+            "first_request_time": first_request_time,
+            "success": response.json().get("success", False)
+        }
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == '__main__':
+    if not os.getenv("OPENROUTER_API_KEY"):
+        print("Warning: OPENROUTER_API_KEY is not set, chat requests will fail without reaching OpenRouter")
+
+    print(f"{'mode':<6} {'startup':>9} {'first chat':>11} {'ok':>4}")
+    for warm_up in (False, True):
+        result = measure(warm_up)
+        print(f"{'warm' if warm_up else 'cold':<6} "
+              f"{result['startup_time']:>8.3f}s "
+              f"{result['first_request_time']:>10.3f}s "
+              f"{'yes' if result['success'] else 'no':>4}")